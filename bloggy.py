@@ -12,6 +12,9 @@ Features:
 - Create symlinks for notes tagged with #now to docs/now directory
 - Extract forward (asset) links from a specific note
 
+Requirements:
+    PyYAML (pip install pyyaml)
+
 Usage:
     python bloggy.py [options]
 
@@ -31,109 +34,402 @@ Notes:
 - The NOTES_DIR variable controls the location of your notes directory (default: ../Notes).
 - Asset links are detected by searching for markdown links containing 'assets' in their path.
 - #now posts are identified by the presence of 'now' in the 'tags' frontmatter field.
+- Parsed frontmatter and asset links are cached in ~/.cache/bloggy/frontmatter.json and
+  reused while a note's modification time is unchanged; delete the file to force a rescan.
 
 """
 
 import sys
 import argparse
+import atexit
+import bisect
+import json
 import re
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Iterator, Tuple
+
+import yaml
+
+# Prefer the libyaml C loader, falling back to the pure-Python one
+try:
+    _BaseYamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _BaseYamlLoader = yaml.SafeLoader
+
+
+class YamlLoader(_BaseYamlLoader):
+    """Safe loader that keeps dates as strings and only reads true/false as bool."""
+
+
+# yes/no/on/off must not become booleans ('public: yes' stays private), and
+# dates stay raw strings so #now link names match the frontmatter verbatim
+_DROPPED_RESOLVERS = ("tag:yaml.org,2002:bool", "tag:yaml.org,2002:timestamp")
+YamlLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp) for tag, regexp in resolvers if tag not in _DROPPED_RESOLVERS
+    ]
+    for first, resolvers in _BaseYamlLoader.yaml_implicit_resolvers.items()
+}
+YamlLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool",
+    re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+    list("tTfF"),
+)
 
 NOTES_DIR = "../Notes"
+# Parsed frontmatter and asset links, keyed by note path and invalidated by mtime
+CACHE_FILE = os.path.expanduser("~/.cache/bloggy/frontmatter.json")
+CACHE_VERSION = 4
 # Regex pattern to extract link path from markdown links: [text](path)
-LINK_REGEX = r"\[[^\]]*\]\(([^)]*)\)"
+# Links never span lines, so the pattern can run over a whole note body at once
+LINK_REGEX = r"\[[^\]\n]*\]\(([^)\n]*)\)"
+_LINK_RE = re.compile(LINK_REGEX)
+# A '---' frontmatter separator line
+_SEPARATOR_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+# Leading "assets/" of an asset link, optionally behind ./ or ../ segments
+_ASSET_PREFIX_RE = re.compile(r"(?:\.\.?/)*assets/")
+# Note filenames that already start with a yyyy-mm-dd date
+_DATE_PREFIX_RE = re.compile(r"(?:19|20)\d{2}-\d{2}-\d{2}")
+# NOTES_DIR is scanned serially up to this many top-level subdirectories
+SERIAL_SCAN_MAX_DIRS = 4
+# Note bodies per worker task when asset links are extracted in processes;
+# the pool is only used for at least two chunks per CPU
+EXTRACT_CHUNK_SIZE = 32
+
+
+def _json_safe_keys(value: Any) -> Any:
+    """Return value with all mapping keys converted to strings for JSON."""
+    if isinstance(value, dict):
+        return {str(key): _json_safe_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_safe_keys(item) for item in value]
+    return value
+
+
+def _extract_asset_links(bodies: List[str]) -> List[List[str]]:
+    """Extract asset links from several note bodies with one regex pass."""
+    offsets = []
+    position = 0
+    for body in bodies:
+        offsets.append(position)
+        position += len(body) + 1
+
+    extracted_links: List[List[str]] = [[] for _ in bodies]
+    for match in _LINK_RE.finditer("\n".join(bodies)):
+        link_path = match.group(1)
+        # Only include links that contain 'assets' (as per LINK_PATTERN)
+        if "assets" in link_path:
+            index = bisect.bisect_right(offsets, match.start()) - 1
+            extracted_links[index].append(link_path)
+
+    return extracted_links
 
 
 class NotesPublisher:
-    def __init__(self, notes_dir: str = NOTES_DIR, verbose: bool = False):
+    def __init__(
+        self,
+        notes_dir: str = NOTES_DIR,
+        verbose: bool = False,
+        cache_file: str | None = CACHE_FILE,
+    ):
         self.notes_dir = Path(notes_dir).resolve()
         self.verbose = verbose
+        # Parsed notes, filled by a single walk of the Notes directory
+        self._note_cache: Dict[str, Dict[str, Any]] = {}
+        self._notes_scanned = False
+        # On-disk metadata cache shared between invocations
+        self.cache_file = cache_file
+        self._meta_cache = self._load_meta_cache()
+        self._meta_cache_dirty = False
+        # Entries and note bodies whose asset links are extracted in one batch
+        # after a scan; entries join the metadata cache once that succeeds
+        self._pending_assets: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        # Query results, computed once per instance
+        self._public_notes_cache: List[str] | None = None
+        self._now_notes_cache: List[Tuple[str, Dict[str, Any]]] | None = None
+        self._public_assets_cache: List[str] | None = None
+        if self.cache_file:
+            atexit.register(self._save_meta_cache)
 
     def log(self, message: str, force: bool = False):
         """Log message if verbose mode is enabled or force is True."""
         if self.verbose or force:
             print(message, file=sys.stderr)
 
-    def parse_frontmatter(self, content: str) -> Dict[str, str]:
-        """Parse YAML frontmatter from markdown content."""
-        frontmatter = {}
-
-        if not content.startswith("---"):
-            return frontmatter
+    def _load_meta_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the on-disk metadata cache, starting empty if it is unusable."""
+        if not self.cache_file:
+            return {}
 
-        # Find the end of frontmatter
-        lines = content.splitlines()
-        end_idx = None
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == "---":
-                end_idx = i
-                break
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.log(f"Ignoring unreadable cache {self.cache_file}: {e}")
+            return {}
 
-        if end_idx is None:
-            return frontmatter
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            self.log(f"Ignoring outdated cache {self.cache_file}")
+            return {}
 
-        # Parse frontmatter lines
-        for line in lines[1:end_idx]:
-            if ":" in line:
-                key, value = line.split(":", 1)
-                frontmatter[key.strip()] = value.strip()
+        return data.get("notes", {})
 
-        return frontmatter
+    def _save_meta_cache(self):
+        """Write the metadata cache back to disk if it changed."""
+        if not self.cache_file or not self._meta_cache_dirty:
+            return
 
-    def is_public_note(self, file_path: Path) -> bool:
-        """Check if a markdown file has 'public: true' in frontmatter."""
+        tmp_file = None
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            cache_dir = os.path.dirname(self.cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            # A unique temp file, so concurrent runs never write the same file
+            fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": CACHE_VERSION, "notes": self._meta_cache},
+                    f,
+                    default=str,  # Other non-JSON YAML values, e.g. !!binary
+                )
+            os.replace(tmp_file, self.cache_file)
+            self._meta_cache_dirty = False
+            self.log(f"Saved metadata cache to {self.cache_file}")
+        except Exception as e:
+            if tmp_file is not None and os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            self.log(f"Error writing cache {self.cache_file}: {e}", force=True)
+
+    def _get_meta(
+        self,
+        md_file: str,
+        mtime: float | None = None,
+        defer_assets: bool = False,
+    ) -> Dict[str, Any] | None:
+        """Return cached frontmatter and asset links for a note, keyed by mtime."""
+        try:
+            if mtime is None:
+                mtime = os.stat(md_file).st_mtime
+            entry = self._meta_cache.get(md_file)
+            if (
+                entry is not None
+                and entry["mtime"] == mtime
+                and entry["assets"] is not None
+            ):
+                return entry
+
+            with open(md_file, "r", encoding="utf-8") as f:
                 content = f.read()
+        except Exception as e:
+            print(f"Error reading {md_file}: {e}")
+            return None
+
+        entry = {
+            "mtime": mtime,
+            "frontmatter": _json_safe_keys(self.parse_frontmatter(content, md_file)),
+            "assets": [],
+        }
+        body = self._asset_body(content)
+        if body and defer_assets:
+            entry["assets"] = None
+            self._pending_assets[md_file] = (entry, body)
+            return entry
+        if body:
+            entry["assets"] = self._extract_asset_batch([body])[0]
+        self._meta_cache[md_file] = entry
+        self._meta_cache_dirty = True
+        return entry
+
+    def parse_frontmatter(self, content: str, source: str = "") -> Dict[str, Any]:
+        """Parse YAML frontmatter from markdown content."""
+        if not content.startswith("---"):
+            return {}
 
-            frontmatter = self.parse_frontmatter(content)
-            return frontmatter.get("public", "").lower() == "true"
+        # Find the end of frontmatter without splitting the whole note into lines
+        start = content.find("\n") + 1
+        if start == 0:
+            return {}
+        closing = _SEPARATOR_RE.search(content, start)
+        if closing is None:
+            return {}
 
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            return False
+        return self._load_frontmatter(content[start : closing.start()], source)
 
-    def has_now_tag(self, file_path: Path) -> bool:
-        """Check if a markdown file contains the #now tag."""
+    def _load_frontmatter(self, text: str, source: str = "") -> Dict[str, Any]:
+        """Load a frontmatter block with PyYAML, falling back to key/value parsing."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-                frontmatter = self.parse_frontmatter(content)
-            return "now" in frontmatter.get("tags", "").lower()
+            frontmatter = yaml.load(text, Loader=YamlLoader)
         except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            return False
+            # Parse errors and constructor errors (e.g. ValueError) alike
+            self.log(
+                f"Frontmatter in {source or 'note'} is not valid YAML, "
+                f"using key/value parsing: {e}",
+                force=True,
+            )
+            return self._parse_frontmatter_lines(text)
 
-    def find_public_notes(self) -> List[Path]:
-        """Scan Notes directory for markdown files with public: true."""
-        public_notes = []
+        if not isinstance(frontmatter, dict):
+            return {}
 
-        if not self.notes_dir.exists():
-            print(f"Notes directory not found: {self.notes_dir}")
-            return public_notes
+        empty_keys = [key for key, value in frontmatter.items() if value is None]
+        if empty_keys:
+            raw = self._parse_frontmatter_lines(text)
+            for key in empty_keys:
+                if raw.get(key):
+                    frontmatter[key] = raw[key]
 
-        for md_file in self.notes_dir.rglob("*.md"):
-            if self.is_public_note(md_file):
-                public_notes.append(md_file)
+        return frontmatter
 
-        return public_notes
+    def _parse_frontmatter_lines(self, text: str) -> Dict[str, str]:
+        """Parse 'key: value' frontmatter lines into a dict of strings."""
+        frontmatter = {}
+        for line in text.splitlines():
+            if ":" in line:
+                key, value = line.split(":", 1)
+                frontmatter[key.strip()] = value.strip()
+
+        return frontmatter
 
-    def find_now_notes(self) -> List[Path]:
-        """Scan Notes directory for markdown files with #now tag."""
-        now_notes = []
+    def _is_public(self, frontmatter: Dict[str, Any]) -> bool:
+        """Check if parsed frontmatter has 'public: true'."""
+        public = frontmatter.get("public")
+        if isinstance(public, str):
+            # Raw string from the key/value fallback
+            return public.lower() == "true"
+        return public is True
+
+    def _has_now(self, frontmatter: Dict[str, Any]) -> bool:
+        """Check if parsed frontmatter carries the #now tag."""
+        tags = frontmatter.get("tags") or []
+        if isinstance(tags, str):
+            # Plain string form, e.g. "tags: now, life" or a raw "[#now]"
+            tags = re.split(r"[\[\],\s]+", tags)
+        elif not isinstance(tags, list):
+            tags = [tags]
+        return "now" in (str(tag).lstrip("#").lower() for tag in tags)
 
-        if not self.notes_dir.exists():
-            print(f"Notes directory not found: {self.notes_dir}")
-            return now_notes
+    def is_public_note(self, file_path: Path) -> bool:
+        """Check if a markdown file has 'public: true' in frontmatter."""
+        meta = self._get_meta(os.path.abspath(file_path))
+        return meta is not None and self._is_public(meta["frontmatter"])
 
-        for md_file in self.notes_dir.rglob("*.md"):
-            if self.has_now_tag(md_file):
-                now_notes.append(md_file)
+    def has_now_tag(self, file_path: Path) -> bool:
+        """Check if a markdown file contains the #now tag."""
+        meta = self._get_meta(os.path.abspath(file_path))
+        return meta is not None and self._has_now(meta["frontmatter"])
 
-        return now_notes
+    def _entry_mtime(self, entry: os.DirEntry) -> float | None:
+        """Return the mtime of a directory entry, or None if it cannot be stat'ed."""
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            # Left to _get_meta, which reports the error when reading the note
+            return None
+
+    def _walk_md(self, *roots: str) -> Iterator[Tuple[str, float | None]]:
+        """Yield (path, mtime) of markdown files below roots."""
+        stack = list(roots)
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md") and entry.is_file():
+                            yield entry.path, self._entry_mtime(entry)
+            except OSError as e:
+                self.log(f"Error scanning {current}: {e}", force=True)
+
+    def _read_tree(self, *roots: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read and parse every note below roots."""
+        notes = []
+        for md_file, mtime in self._walk_md(*roots):
+            meta = self._get_meta(md_file, mtime, defer_assets=True)
+            if meta is not None:
+                notes.append((md_file, meta))
+        return notes
+
+    def _scan_notes_dir(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read every note in the Notes directory, in parallel for large trees."""
+        root = str(self.notes_dir)
+        top_dirs = []
+        top_files = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        top_dirs.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        top_files.append((entry.path, self._entry_mtime(entry)))
+        except OSError as e:
+            self.log(f"Error scanning {root}: {e}", force=True)
+            return []
+
+        notes = []
+        for md_file, mtime in top_files:
+            meta = self._get_meta(md_file, mtime, defer_assets=True)
+            if meta is not None:
+                notes.append((md_file, meta))
+
+        if len(top_dirs) <= SERIAL_SCAN_MAX_DIRS:
+            notes.extend(self._read_tree(*top_dirs))
+            return notes
+
+        self.log(f"Scanning {len(top_dirs)} top-level directories in parallel")
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for tree_notes in executor.map(self._read_tree, top_dirs):
+                notes.extend(tree_notes)
+
+        return notes
+
+    def _iter_notes(self) -> Iterator[Tuple[str, Dict[str, Any], List[str]]]:
+        """Yield (path, frontmatter, asset links) for every note, scanning once."""
+        if not self._notes_scanned:
+            self._notes_scanned = True
+
+            if not self.notes_dir.exists():
+                print(f"Notes directory not found: {self.notes_dir}")
+                return
+
+            for md_file, meta in self._scan_notes_dir():
+                self._note_cache[md_file] = meta
+            self._resolve_pending_assets()
+
+            # Drop cache entries for notes that no longer exist
+            prefix = str(self.notes_dir) + os.sep
+            for md_file in list(self._meta_cache):
+                if md_file.startswith(prefix) and md_file not in self._note_cache:
+                    del self._meta_cache[md_file]
+                    self._meta_cache_dirty = True
+
+        for md_file, meta in self._note_cache.items():
+            yield md_file, meta["frontmatter"], meta["assets"]
+
+    def find_public_notes(self) -> List[str]:
+        """Scan Notes directory for markdown files with public: true."""
+        if self._public_notes_cache is None:
+            self._public_notes_cache = [
+                md_file
+                for md_file, frontmatter, _ in self._iter_notes()
+                if self._is_public(frontmatter)
+            ]
+        return self._public_notes_cache
+
+    def find_now_notes(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Scan Notes directory for #now notes, returning (path, frontmatter) pairs."""
+        if self._now_notes_cache is None:
+            self._now_notes_cache = [
+                (md_file, frontmatter)
+                for md_file, frontmatter, _ in self._iter_notes()
+                if self._has_now(frontmatter)
+            ]
+        return self._now_notes_cache
 
     def scan_notes(self):
         """Scan and display public notes found."""
@@ -152,42 +448,79 @@ class NotesPublisher:
         public_notes = self.find_public_notes()
 
         self.log(f"Outputting {len(public_notes)} public note paths")
-        for note in public_notes:
-            print(note.resolve())
+        # Paths from the walk are already absolute under the resolved notes_dir
+        if public_notes:
+            sys.stdout.write("\n".join(public_notes) + "\n")
+
+    def _asset_body(self, content: str) -> str:
+        """Return the part of a note after its frontmatter that can hold asset links."""
+        # Find end of frontmatter (the second separator line)
+        separators = _SEPARATOR_RE.finditer(content)
+        next(separators, None)
+        frontmatter_end = next(separators, None)
+        body_start = frontmatter_end.end() if frontmatter_end else 0
+
+        first_asset = content.find("assets", body_start)
+        if first_asset < 0:
+            return ""
+        line_start = content.rfind("\n", body_start, first_asset) + 1
+        return content[max(line_start, body_start) :]
+
+    def _extract_asset_batch(self, bodies: List[str]) -> List[List[str]]:
+        """Extract asset links from note bodies, pooling large per-CPU batches."""
+        cpu_count = os.cpu_count() or 1
+        # Worth a pool only with at least two chunks per CPU
+        min_parallel = 2 * cpu_count * EXTRACT_CHUNK_SIZE
+        if cpu_count < 2 or len(bodies) < min_parallel:
+            extracted_links = _extract_asset_links(bodies)
+        else:
+            chunks = [
+                bodies[i : i + EXTRACT_CHUNK_SIZE]
+                for i in range(0, len(bodies), EXTRACT_CHUNK_SIZE)
+            ]
+            self.log(f"Extracting asset links in {len(chunks)} parallel chunks")
+            with ProcessPoolExecutor() as executor:
+                extracted_links = [
+                    links
+                    for chunk_links in executor.map(_extract_asset_links, chunks)
+                    for links in chunk_links
+                ]
+
+        for links in extracted_links:
+            for link_path in links:
+                self.log(f"  Found asset link: {link_path}")
+
+        return extracted_links
+
+    def _resolve_pending_assets(self):
+        """Fill in asset links for notes read with defer_assets."""
+        if not self._pending_assets:
+            return
+
+        pending = list(self._pending_assets.items())
+        bodies = [body for _, (_, body) in pending]
+
+        self.log(f"Extracting asset links from {len(bodies)} notes")
+        try:
+            extracted_links = self._extract_asset_batch(bodies)
+            for (md_file, (entry, _)), assets in zip(pending, extracted_links):
+                entry["assets"] = assets
+                self._meta_cache[md_file] = entry
+                self._meta_cache_dirty = True
+        finally:
+            # On failure the entries never reach the cache, so nothing with
+            # missing assets is written to disk
+            self._pending_assets = {}
 
     def extract_assets_from_file(self, file_path: Path) -> List[str]:
         """Extract asset links from a single markdown file."""
         self.log(f"Extracting assets from: {file_path.name}")
         extracted_links = []
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-                lines = content.splitlines()
-                end_idx = 0
-                frontmatter_separator_count = 0
-
-                # Find end of frontmatter
-                for i, line in enumerate(lines):
-                    if line.strip() == "---":
-                        frontmatter_separator_count += 1
-                        if frontmatter_separator_count == 2:
-                            end_idx = i
-                            break
-
-                # Extract links from content after frontmatter
-                content_lines = lines[end_idx + 1 :] if end_idx > 0 else lines
-                for line in content_lines:
-                    # Find all link paths in the line
-                    link_paths = re.findall(LINK_REGEX, line)
-                    for link_path in link_paths:
-                        # Only include links that contain 'assets' (as per LINK_PATTERN)
-                        if "assets" in link_path:
-                            self.log(f"  Found asset link: {link_path}")
-                            extracted_links.append(link_path)
-
-        except Exception as e:
-            self.log(f"Error reading {file_path}: {e}", force=True)
+        md_file = os.path.abspath(file_path)
+        # Notes already seen by the directory scan need no stat or read
+        meta = self._note_cache.get(md_file) or self._get_meta(md_file)
+        if meta is not None:
+            extracted_links = meta["assets"]
 
         self.log(
             f"  Extracted {len(extracted_links)} asset links from {file_path.name}"
@@ -200,11 +533,14 @@ class NotesPublisher:
         extracted_links = self.extract_assets_from_file(file_path)
 
         self.log(f"Outputting {len(extracted_links)} forward links")
-        for link_path in extracted_links:
-            print(link_path)
+        if extracted_links:
+            sys.stdout.write("\n".join(extracted_links) + "\n")
 
     def collect_public_assets(self) -> List[str]:
         """Collect all asset links from public notes."""
+        if self._public_assets_cache is not None:
+            return self._public_assets_cache
+
         self.log("Starting collection of public assets...")
         public_notes = self.find_public_notes()
         all_public_assets = set()  # Use set to avoid duplicates
@@ -214,12 +550,14 @@ class NotesPublisher:
         )
 
         for note in public_notes:
-            assets = self.extract_assets_from_file(note)
+            name = os.path.basename(note)
+            assets = self._note_cache[note]["assets"]
             all_public_assets.update(assets)
-            self.log(f"  {note.name}: {len(assets)} assets", force=True)
+            self.log(f"  {name}: {len(assets)} assets", force=True)
 
         unique_assets = sorted(list(all_public_assets))
         self.log(f"Total unique public assets found: {len(unique_assets)}")
+        self._public_assets_cache = unique_assets
         return unique_assets
 
     def output_public_assets(self):
@@ -231,8 +569,8 @@ class NotesPublisher:
             f"Found {len(public_assets)} unique assets in public notes:", force=True
         )
 
-        for asset_path in public_assets:
-            print(asset_path)
+        if public_assets:
+            sys.stdout.write("\n".join(public_assets) + "\n")
 
     def link_public_assets(self, target_dir: Path | None = None):
         """Create symlinks for public assets from Notes/assets to docs/posts/assets."""
@@ -263,28 +601,57 @@ class NotesPublisher:
             f"Linking {len(public_assets)} public assets to {target_dir}...", force=True
         )
 
+        # Resolve the source directory once; link targets are built from it
+        resolved_source_dir = os.path.realpath(source_assets_dir)
+        # Plain strings keep Path object construction out of the loop
+        source_dir = str(source_assets_dir)
+        target_root = str(target_dir)
+        created_dirs = set()
+
         linked_count = 0
         for asset_path in public_assets:
-            # Convert relative asset path to absolute source path
-            source_path = source_assets_dir / asset_path.replace("assets/", "")
-            target_path = target_dir / asset_path.replace("assets/", "")
+            # Convert relative asset path to absolute source path; only a
+            # leading "assets/" (after any ./ or ../ segments) is stripped
+            prefix = _ASSET_PREFIX_RE.match(asset_path)
+            relative_path = asset_path[prefix.end() :] if prefix else asset_path
+            source_path = os.path.join(source_dir, relative_path)
+            target_path = os.path.join(target_root, relative_path)
+            resolved_source = os.path.normpath(
+                os.path.join(resolved_source_dir, relative_path)
+            )
 
             self.log(f"  Source: {source_path}")
             self.log(f"  Target: {target_path}")
 
+            if not os.path.exists(resolved_source):
+                # Remove the stale link so unpublished assets do not linger
+                if os.path.lexists(target_path):
+                    os.unlink(target_path)
+                self.log(f"Warning: Source file not found: {source_path}", force=True)
+                continue
+
+            # Skip links that already point at the right file
+            try:
+                if os.readlink(target_path) == resolved_source:
+                    self.log("  Already linked")
+                    linked_count += 1
+                    continue
+            except OSError:
+                pass
+
             # Create parent directories in target if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            parent_dir = os.path.dirname(target_path)
+            if parent_dir not in created_dirs:
+                os.makedirs(parent_dir, exist_ok=True)
+                created_dirs.add(parent_dir)
 
             # Remove existing symlink if it exists
-            if target_path.exists() or target_path.is_symlink():
-                target_path.unlink()
+            if os.path.lexists(target_path):
+                os.unlink(target_path)
 
             # Create symlink
-            if source_path.exists():
-                os.symlink(source_path.resolve(), target_path)
-                linked_count += 1
-            else:
-                self.log(f"Warning: Source file not found: {source_path}", force=True)
+            os.symlink(resolved_source, target_path)
+            linked_count += 1
 
         self.log(
             f"Successfully linked {linked_count}/{len(public_assets)} assets",
@@ -308,45 +675,43 @@ class NotesPublisher:
         self.log(f"Found {len(now_posts)} #now posts", force=True)
 
         linked_count = 0
-        for post in now_posts:
-            filename = post.name
+        for post, frontmatter in now_posts:
+            filename = os.path.basename(post)
 
             # Check if filename already has date format (yyyy-mm-dd)
-            if (
-                filename.startswith(("20", "19"))
-                and len(filename) >= 10
-                and filename[4] == "-"
-                and filename[7] == "-"
-            ):
+            if _DATE_PREFIX_RE.match(filename):
                 # File already has date format, use as-is
                 target_filename = filename
                 self.log(f"File {filename} already has date format, linking directly")
             else:
-                # Extract date from frontmatter
-                try:
-                    with open(post, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    frontmatter = self.parse_frontmatter(content)
-                    date_str = frontmatter.get("date", "")
-
-                    if date_str:
-                        target_filename = f"{date_str}_{filename}"
-                    else:
-                        target_filename = filename
-                except Exception as e:
-                    self.log(f"Error reading frontmatter from {post}: {e}", force=True)
+                # Extract date from the frontmatter parsed during the scan
+                date_str = frontmatter.get("date", "")
+
+                if date_str:
+                    target_filename = f"{date_str}_{filename}"
+                else:
                     target_filename = filename
 
             target_path = target_dir / target_filename
             self.log(f"  Source: {post}")
             self.log(f"  Target: {target_path}")
 
+            # Skip links that already point at the post; note paths come from
+            # the walk of the resolved Notes directory, so they are absolute
+            try:
+                if os.readlink(target_path) == post:
+                    linked_count += 1
+                    self.log(f"  Already linked: {target_filename}")
+                    continue
+            except OSError:
+                pass
+
             # Remove existing symlink if it exists
-            if target_path.exists() or target_path.is_symlink():
-                target_path.unlink()
+            if os.path.lexists(target_path):
+                os.unlink(target_path)
 
             # Create symlink
-            os.symlink(post.resolve(), target_path)
+            os.symlink(post, target_path)
             linked_count += 1
             self.log(f"  Linked: {target_filename}", force=True)
 